@@ -3,6 +3,7 @@ Data Connector Module for EDA LLM Assistant
 
 This module provides unified data loading functionality for various data sources:
 - CSV, Excel, JSON files
+- Parquet, Feather files
 - SQLite databases
 - BigQuery
 - MySQL
@@ -11,132 +12,945 @@ This module provides unified data loading functionality for various data sources
 Author: EDA LLM Assistant
 """
 
+import asyncio
+import importlib.util
+import io
+import os
 import pandas as pd
 import sqlite3
 import json
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterable, Iterator, Union
 import warnings
 
+logger = logging.getLogger(__name__)
+
+# (major, minor) of the installed pandas, for features that need a newer release
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+
+# Keyword arguments the PyArrow CSV/JSON readers know how to translate.
+# Anything else makes the reader fall back to the pandas engine.
+_PYARROW_CSV_KWARGS = {'dtype', 'na_values', 'keep_default_na', 'usecols', 'sep', 'delimiter'}
+_PYARROW_JSON_KWARGS = {'lines'}
+_PYARROW_BLOCK_SIZE = 8 << 20
+
+
+def _arrow_type(dtype):
+    """Map a pandas/numpy dtype spec to a pyarrow type"""
+    import pyarrow as pa
+    if dtype in (str, 'str', 'string', object, 'object'):
+        return pa.string()
+    return pa.from_numpy_dtype(pd.api.types.pandas_dtype(dtype))
+
+
+def _read_csv_pyarrow(path: str, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Read a CSV file with PyArrow's multithreaded reader.
+    
+    Returns None when the kwargs cannot be expressed with PyArrow options,
+    so the caller can fall back to pandas.
+    """
+    if set(kwargs) - _PYARROW_CSV_KWARGS:
+        return None
+    
+    try:
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        raise ImportError("pyarrow is required for engine='pyarrow'. Install with: pip install pyarrow")
+    
+    convert_args = {}
+    dtype = kwargs.get('dtype')
+    if dtype is not None:
+        if not isinstance(dtype, dict):
+            return None
+        try:
+            convert_args['column_types'] = {col: _arrow_type(t) for col, t in dtype.items()}
+        except (TypeError, NotImplementedError):
+            return None
+    
+    na_values = kwargs.get('na_values')
+    keep_default_na = kwargs.get('keep_default_na', True)
+    if na_values is not None or not keep_default_na:
+        if isinstance(na_values, dict):
+            return None
+        if na_values is None:
+            na_values = []
+        elif isinstance(na_values, str):
+            na_values = [na_values]
+        # Like pandas, extra na_values add to the default markers unless keep_default_na=False
+        default_nulls = pa_csv.ConvertOptions().null_values if keep_default_na else []
+        convert_args['null_values'] = list(default_nulls) + list(na_values)
+        convert_args['strings_can_be_null'] = True
+    
+    usecols = kwargs.get('usecols')
+    if usecols is not None:
+        if callable(usecols) or not all(isinstance(c, str) for c in usecols):
+            return None
+    
+    delimiter = kwargs.get('sep', kwargs.get('delimiter')) or ','
+    if len(delimiter) != 1:
+        return None
+    
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=_PYARROW_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(**convert_args),
+    )
+    if usecols is not None:
+        # Select after parsing: include_columns would follow the usecols order,
+        # while pandas keeps the file order
+        missing = set(usecols) - set(table.column_names)
+        if missing:
+            raise ValueError(f"Usecols do not match columns, columns expected but not found: {sorted(missing)}")
+        table = table.select([col for col in table.column_names if col in set(usecols)])
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+def _read_json_pyarrow(path: str, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Read a newline-delimited JSON file with PyArrow's multithreaded reader.
+    
+    Returns None when the input is not line-delimited, other kwargs are
+    given or PyArrow cannot parse the file (e.g. mixed-type columns), so the
+    caller can fall back to pandas.
+    """
+    if set(kwargs) - _PYARROW_JSON_KWARGS or not kwargs.get('lines'):
+        return None
+    
+    try:
+        import pyarrow as pa
+        from pyarrow import json as pa_json
+    except ImportError:
+        raise ImportError("pyarrow is required for engine='pyarrow'. Install with: pip install pyarrow")
+    
+    try:
+        table = pa_json.read_json(
+            path,
+            read_options=pa_json.ReadOptions(use_threads=True, block_size=_PYARROW_BLOCK_SIZE),
+        )
+    except pa.ArrowInvalid as e:
+        logger.debug("PyArrow could not parse %s, falling back to pandas: %s", path, e)
+        return None
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+def _read_json_orjson(path: str, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Read a JSON document with orjson and build a DataFrame from it.
+    
+    Unlike pd.read_json, dates and axis labels are not converted. Returns
+    None when other kwargs are given or orjson cannot parse the file, so the
+    caller can fall back to pandas.
+    """
+    if kwargs:
+        return None
+    
+    try:
+        import orjson
+    except ImportError:
+        raise ImportError("orjson is required for engine='orjson'. Install with: pip install orjson")
+    
+    with open(path, 'rb') as f:
+        try:
+            obj = orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
+            logger.debug("orjson could not parse %s, falling back to pandas: %s", path, e)
+            return None
+    return pd.DataFrame(obj)
+
+
+_SQL_BACKENDS = ('sqlalchemy', 'connectorx', 'adbc')
+
+
+def _resolve_sql_backend(backend: Optional[str], chunksize: Optional[int], **kwargs) -> str:
+    """
+    Pick the backend used for a MySQL/PostgreSQL read
+    
+    The Arrow-native backends only run plain, non-chunked queries. By default
+    connectorx is used when installed and SQLAlchemy otherwise, or when
+    chunksize or other kwargs are given; an explicitly chosen Arrow-native
+    backend raises ValueError for those instead.
+    """
+    if backend is not None and backend not in _SQL_BACKENDS:
+        raise ValueError(f"Unsupported SQL backend: {backend}. Choose from {', '.join(_SQL_BACKENDS)}")
+    if backend is None:
+        if chunksize or kwargs or importlib.util.find_spec('connectorx') is None:
+            return 'sqlalchemy'
+        return 'connectorx'
+    if backend != 'sqlalchemy':
+        if chunksize:
+            raise ValueError(f"backend='{backend}' does not support chunksize; use backend='sqlalchemy'")
+        if kwargs:
+            raise ValueError(f"backend='{backend}' does not support arguments: {', '.join(sorted(kwargs))}; "
+                             "use backend='sqlalchemy'")
+    return backend
+
+
+def _limit_sql(sql: str, limit: Optional[int]) -> str:
+    """Wrap a query so that it returns at most limit rows"""
+    if limit is None:
+        return sql
+    return f"SELECT * FROM ({sql.rstrip().rstrip(';')}) AS _limited LIMIT {int(limit)}"
+
+
+def _read_sql(sql: str, con, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Call pd.read_sql, building results directly into Arrow-backed columns
+    
+    Arrow-backed results avoid the intermediate object-dtype column copies of
+    the default NumPy backend; pass dtype_backend explicitly to override.
+    """
+    kwargs.setdefault('dtype_backend', 'pyarrow')
+    return pd.read_sql(sql, con, **kwargs)
+
+
+def _read_sql_arrow(sql: str, dsn: str, backend: str) -> pd.DataFrame:
+    """
+    Run a query through an Arrow-native driver (connectorx or ADBC)
+    
+    Args:
+        sql: SQL query to execute
+        dsn: Connection URL; a SQLAlchemy driver suffix such as '+pymysql' is ignored
+        backend: 'connectorx' or 'adbc'
+    
+    Returns:
+        pandas DataFrame with Arrow-backed columns
+    """
+    scheme, rest = dsn.split('://', 1)
+    uri = f"{scheme.split('+')[0]}://{rest}"
+    
+    if backend == 'connectorx':
+        try:
+            import connectorx as cx
+        except ImportError:
+            raise ImportError("connectorx is required for backend='connectorx'. Install with: pip install connectorx")
+        table = cx.read_sql(uri, sql, return_type='arrow')
+    else:
+        if not uri.startswith('postgresql://'):
+            raise ValueError("The 'adbc' backend is only available for PostgreSQL")
+        try:
+            import adbc_driver_postgresql.dbapi as adbc_pg
+        except ImportError:
+            raise ImportError("adbc-driver-postgresql is required for backend='adbc'. "
+                              "Install with: pip install adbc-driver-postgresql")
+        with adbc_pg.connect(uri) as conn, conn.cursor() as cursor:
+            cursor.execute(sql)
+            table = cursor.fetch_arrow_table()
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+# Files must be at least this large before parallel=True splits them into byte ranges;
+# below it, starting worker processes costs more than it saves
+_PARALLEL_CSV_THRESHOLD = 512 << 20
+
+# Keyword arguments that depend on absolute row positions or non-newline framing,
+# or that change which physical line holds the header, so a byte-range split
+# would change the result
+_PARALLEL_CSV_UNSAFE_KWARGS = {'skiprows', 'skipfooter', 'nrows', 'header', 'names',
+                               'compression', 'iterator', 'lineterminator', 'comment',
+                               'skip_blank_lines'}
+_COMPRESSED_SUFFIXES = {'.gz', '.bz2', '.zip', '.xz', '.zst', '.tar'}
+
+
+def _can_parallel_read_csv(path, **kwargs) -> bool:
+    """Check whether a CSV read can be split into byte ranges and is large enough to be worth it"""
+    if not isinstance(path, (str, os.PathLike)) or not os.path.isfile(path):
+        return False
+    if (os.cpu_count() or 1) < 2 or os.path.getsize(path) < _PARALLEL_CSV_THRESHOLD:
+        return False
+    if Path(path).suffix.lower() in _COMPRESSED_SUFFIXES:
+        return False
+    if set(kwargs) & _PARALLEL_CSV_UNSAFE_KWARGS:
+        return False
+    # Multi-byte encodings do not frame lines on a single b'\n'
+    encoding = str(kwargs.get('encoding') or '').lower().replace('-', '').replace('_', '')
+    return not encoding.startswith(('utf16', 'utf32'))
+
+
+def _read_csv_range(path: str, start: int, end: int, names: List[str],
+                    kwargs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Parse the lines of a CSV file that start within the byte range [start, end)
+    
+    Args:
+        path: Path to CSV file
+        start: First byte of the range
+        end: Byte after the end of the range
+        names: Column names taken from the header line
+        kwargs: Additional arguments for pd.read_csv()
+    
+    Returns:
+        pandas DataFrame, or None if no line starts within the range
+    """
+    with open(path, 'rb') as f:
+        # Skip the tail of a line owned by the previous range
+        f.seek(start - 1)
+        f.readline()
+        begin = f.tell()
+        if begin >= end:
+            return None
+        data = f.read(end - begin)
+        if not data.endswith(b'\n'):
+            data += f.readline()
+    return pd.read_csv(io.BytesIO(data), header=None, names=names, **kwargs)
+
+
+def _parallel_read_csv(path: str, n_workers: Optional[int] = None, **kwargs) -> pd.DataFrame:
+    """
+    Read a large CSV file by parsing byte ranges in separate processes
+    
+    Each range is aligned to line boundaries, so quoted fields must not
+    contain embedded newlines. Ranges infer their dtypes independently; if
+    any two disagree, the whole file is re-read with a single parser so the
+    result matches pd.read_csv().
+    
+    Args:
+        path: Path to CSV file
+        n_workers: Number of worker processes (default: CPU count)
+        **kwargs: Additional arguments for pd.read_csv()
+    
+    Returns:
+        pandas DataFrame
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers < 2:
+        return pd.read_csv(path, **kwargs)
+    kwargs.pop('memory_map', None)
+    # The header gives the full column list; usecols/index_col are applied per range
+    header_kwargs = {k: v for k, v in kwargs.items() if k not in ('usecols', 'index_col')}
+    names = list(pd.read_csv(path, nrows=0, **header_kwargs).columns)
+    with open(path, 'rb') as f:
+        # pandas skips blank lines before the header, so the data starts after
+        # the first non-blank line
+        line = f.readline()
+        while line and not line.strip(b'\r\n'):
+            line = f.readline()
+        data_start = f.tell()
+    size = os.path.getsize(path)
+    if size <= data_start:
+        return pd.read_csv(path, nrows=0, **kwargs)
+    
+    step = -(-(size - data_start) // n_workers)
+    bounds = [(start, min(start + step, size)) for start in range(data_start, size, step)]
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_read_csv_range, path, start, end, names, kwargs) for start, end in bounds]
+        frames = [f for f in (future.result() for future in futures) if f is not None]
+    
+    if not frames:
+        return pd.read_csv(path, nrows=0, **kwargs)
+    if any(not frame.dtypes.equals(frames[0].dtypes) for frame in frames[1:]):
+        # e.g. a column that is numeric in one range and text in another
+        logger.debug("Byte ranges of %s inferred different dtypes, re-reading with a single parser", path)
+        return pd.read_csv(path, **kwargs)
+    return pd.concat(frames, ignore_index='index_col' not in kwargs)
+
+
+def _read_arrow_file(path: str, fmt: str, columns: Optional[List[str]] = None,
+                     **kwargs) -> pd.DataFrame:
+    """
+    Read a Parquet or Feather file into pandas through PyArrow
+    
+    Args:
+        path: Path to the file
+        fmt: 'parquet' or 'feather'
+        columns: Columns to read (default: all)
+        **kwargs: Additional arguments for pyarrow.parquet.read_table() or
+            pyarrow.feather.read_table()
+    
+    Returns:
+        pandas DataFrame
+    """
+    try:
+        if fmt == 'parquet':
+            from pyarrow.parquet import read_table
+        else:
+            from pyarrow.feather import read_table
+    except ImportError:
+        raise ImportError(f"pyarrow is required for {fmt.title()} files. Install with: pip install pyarrow")
+    table = read_table(path, columns=columns, use_threads=True, **kwargs)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+# Parquet schema metadata keys holding the read options a cache file was written with
+# and the positions of its Arrow-backed (pd.ArrowDtype) columns
+_CACHE_KEY_METADATA = b'data_connector.read_csv'
+_CACHE_ARROW_COLUMNS_METADATA = b'data_connector.arrow_columns'
+
+
+def _csv_cache_key(engine: Optional[str], **kwargs) -> str:
+    """Serialize the read options that determine a CSV read's result"""
+    # Values without a stable repr (e.g. callables) never match, so they just skip the cache
+    return json.dumps({'engine': engine, 'kwargs': kwargs}, sort_keys=True, default=repr)
+
+
+def _read_parquet_cache(cache_path: str, source_path: str, cache_key: str) -> Optional[pd.DataFrame]:
+    """Read a Parquet cache if it is fresh and was written with the same read options"""
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(source_path):
+        return None
+    try:
+        import pyarrow.parquet as pq
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except Exception:
+        return None
+    if metadata.get(_CACHE_KEY_METADATA) != cache_key.encode():
+        return None
+    
+    # pandas metadata alone restores string[pyarrow] columns as StringDtype,
+    # so convert the columns that were Arrow-backed when written
+    arrow_columns = json.loads(metadata.get(_CACHE_ARROW_COLUMNS_METADATA, b'{}'))
+    table = pq.read_table(cache_path, use_threads=True)
+    if arrow_columns.get('all'):
+        return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+    positions = arrow_columns.get('positions', [])
+    # Data columns come before any stored index columns in the Arrow schema
+    arrow_types = [table.schema.field(i).type for i in positions]
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    for i, arrow_type in zip(positions, arrow_types):
+        df.isetitem(i, df.iloc[:, i].astype(pd.ArrowDtype(arrow_type)))
+    return df
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: str, cache_key: str):
+    """Write a DataFrame to a Parquet cache file, warning instead of failing"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df)
+        positions = [i for i, dtype in enumerate(df.dtypes) if isinstance(dtype, pd.ArrowDtype)]
+        arrow_columns = {'all': bool(positions) and len(positions) == df.shape[1], 'positions': positions}
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               _CACHE_KEY_METADATA: cache_key.encode(),
+                                               _CACHE_ARROW_COLUMNS_METADATA: json.dumps(arrow_columns).encode()})
+        pq.write_table(table, cache_path, compression='zstd')
+        logger.info("   Cached as Parquet: %s", cache_path)
+    except Exception as e:
+        warnings.warn(f"Could not write Parquet cache {cache_path}: {e}")
+
+
+def _log_loaded(df: pd.DataFrame):
+    """Log the shape of a loaded DataFrame"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Successfully loaded %s rows and %d columns", format(df.shape[0], ","), df.shape[1])
+
+
+# Log formats for query previews
+_SQLITE_QUERY_FMT = "   Query: %s"
+_EXECUTING_QUERY_FMT = "   Executing query: %s"
+_QUERY_PREVIEW_LEN = 100
+
+
+def _short(text: str, limit: int = _QUERY_PREVIEW_LEN) -> str:
+    """Truncate text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _log_query(fmt: str, query: str):
+    """Log a truncated query preview, skipping the string work when INFO is off"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(fmt, _short(query))
+
+
+_console_handler: Optional[logging.Handler] = None
+
+
+def _set_console_logging(enabled: bool):
+    """Turn printing of this module's INFO messages to stderr on or off"""
+    global _console_handler
+    if enabled:
+        logger.setLevel(logging.INFO)
+        if _console_handler is None and not logging.getLogger().handlers:
+            _console_handler = logging.StreamHandler()
+            _console_handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(_console_handler)
+            # Root has no handlers to print the message a second time, but one may be added later
+            logger.propagate = False
+    else:
+        logger.setLevel(logging.NOTSET)
+        if _console_handler is not None:
+            logger.removeHandler(_console_handler)
+            _console_handler = None
+            logger.propagate = True
+
+
+def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a DataFrame to Arrow-backed dtypes and downcast numeric columns
+    
+    Integers and floats are narrowed to the smallest type that holds their
+    values (floats may lose precision when downcast to float32), and object
+    strings become pyarrow strings.
+    
+    Args:
+        df: DataFrame to convert
+    
+    Returns:
+        Converted DataFrame
+    """
+    df = df.convert_dtypes(dtype_backend="pyarrow")
+    for col in df.select_dtypes("integer"):
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes("float"):
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    return df
+
+
+class _ChunkIterator:
+    """
+    Iterator over DataFrame chunks from a reader, reporting the total once exhausted
+    
+    Cleanup runs when iteration ends, when close() is called, or when the
+    iterator is garbage collected, so a result that is never iterated still
+    releases its file handle or pooled connection. It can also be used as a
+    context manager.
+    
+    Args:
+        chunks: Iterable of DataFrames (e.g. a pandas TextFileReader)
+        on_close: Optional cleanup callback run once when the iterator is closed
+        transform: Optional function applied to each chunk before it is returned
+    """
+    
+    def __init__(self, chunks: Iterable[pd.DataFrame],
+                 on_close: Optional[Callable[[], None]] = None,
+                 transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None):
+        self._chunks = iter(chunks)
+        self._on_close = on_close
+        self._transform = transform
+        self._n_rows = 0
+        self._n_chunks = 0
+    
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return self
+    
+    def __next__(self) -> pd.DataFrame:
+        if self._chunks is None:
+            raise StopIteration
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully streamed %s rows in %d chunks",
+                            format(self._n_rows, ","), self._n_chunks)
+            self.close()
+            raise
+        except BaseException:
+            self.close()
+            raise
+        if self._transform is not None:
+            chunk = self._transform(chunk)
+        self._n_rows += chunk.shape[0]
+        self._n_chunks += 1
+        return chunk
+    
+    def close(self):
+        """Stop iterating and release the underlying reader or connection"""
+        chunks, self._chunks = self._chunks, None
+        on_close, self._on_close = self._on_close, None
+        if chunks is not None and hasattr(chunks, 'close'):
+            chunks.close()
+        if on_close is not None:
+            on_close()
+    
+    def __enter__(self) -> '_ChunkIterator':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+
+
 class DataConnector:
     """
     Unified data connector class for loading data from various sources
     """
     
-    def __init__(self):
+    # File extension -> name of the read method used by auto_detect_and_read()
+    _DISPATCH: Dict[str, Union[str, Callable[..., Any]]] = {
+        '.csv': 'read_csv',
+        '.xlsx': 'read_excel',
+        '.xls': 'read_excel',
+        '.json': 'read_json',
+        '.jsonl': 'read_json',
+        '.parquet': 'read_parquet',
+        '.feather': 'read_feather',
+        '.db': '_read_sqlite_auto',
+        '.sqlite': '_read_sqlite_auto',
+        '.sqlite3': '_read_sqlite_auto',
+    }
+    # Reader method -> method that previews the first rows without a full read
+    _PEEK_DISPATCH: Dict[str, str] = {
+        'read_csv': '_peek_csv',
+        'read_excel': '_peek_excel',
+        'read_json': '_peek_json',
+        'read_parquet': '_peek_parquet',
+        'read_feather': '_peek_feather',
+        '_read_sqlite_auto': '_peek_sqlite',
+    }
+    # Rows sampled by schema() when the format has no stored schema
+    _SCHEMA_SAMPLE_ROWS = 1000
+    
+    @classmethod
+    def register(cls, extension: str, handler: Union[str, Callable[..., Any]]):
+        """
+        Register a reader for a file extension used by auto_detect_and_read()
+        
+        Args:
+            extension: File extension, e.g. '.parquet'
+            handler: Name of a DataConnector method, or a function called as
+                handler(connector, path, **kwargs)
+        """
+        extension = extension.lower()
+        if not extension.startswith('.'):
+            extension = f'.{extension}'
+        # Copy so registering on a subclass does not change the parent's table
+        cls._DISPATCH = {**cls._DISPATCH, extension: handler}
+    
+    def __init__(self, verbose: Optional[bool] = None):
+        """
+        Args:
+            verbose: If True, show this module's progress messages: through the
+                application's handlers when root logging is configured, otherwise
+                printed to stderr. False turns that off again; None (default)
+                leaves the logging configuration unchanged. The setting applies to
+                the whole module, not just this instance
+        """
         self.connection_cache = {}
+        self._cache_lock = threading.Lock()
+        if verbose is not None:
+            _set_console_logging(verbose)
     
-    def read_csv(self, path: str, **kwargs) -> pd.DataFrame:
+    def close(self):
+        """
+        Release cached connections and clients and dispose of pooled SQLAlchemy engines
+        """
+        with self._cache_lock:
+            for key, conn in self.connection_cache.items():
+                if key[0] == 'engine':
+                    conn.dispose()
+                elif key[0] == 'sqlite':
+                    conn.close()
+                elif key[0] == 'bigquery':
+                    client, read_client, _ = conn
+                    client.close()
+                    if read_client is not None:
+                        # GAPIC clients have no close(); their gRPC channel lives on the transport
+                        read_client.transport.close()
+            self.connection_cache.clear()
+    
+    def _get_sqlite(self, path: str) -> sqlite3.Connection:
+        """
+        Return a cached read-only connection to a SQLite database
+        
+        The connection is opened on first use with a large page cache and
+        memory-mapped I/O, so repeat reads of the same file stay warm.
+        
+        Args:
+            path: Path to SQLite database file
+        
+        Returns:
+            sqlite3 Connection
+        """
+        resolved = Path(path).resolve()
+        key = ('sqlite', str(resolved))
+        with self._cache_lock:
+            conn = self.connection_cache.get(key)
+            if conn is None:
+                # mode=ro fails on a missing file instead of creating an empty database
+                conn = sqlite3.connect(f"{resolved.as_uri()}?mode=ro", uri=True,
+                                       check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA cache_size=-262144")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("PRAGMA mmap_size=1073741824")
+                self.connection_cache[key] = conn
+        return conn
+    
+    def read_csv(self, path: str, engine: Optional[str] = None, chunksize: Optional[int] = None,
+                 downcast: bool = False, parallel: bool = False, cache_as_parquet: bool = False,
+                 **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read CSV file
         
         Args:
             path: Path to CSV file
+            engine: Parser engine. 'pyarrow' uses PyArrow's multithreaded reader
+                and falls back to pandas for unsupported kwargs
+            chunksize: Number of rows per chunk. If given, returns an iterator
+                of DataFrames instead of a single DataFrame
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            parallel: If True, split uncompressed files over 512 MB into byte ranges
+                parsed in separate processes on multi-core machines. Only use this
+                when quoted fields contain no embedded newlines; reads with
+                row-position kwargs (skiprows, nrows, comment, ...) always use a
+                single parser
+            cache_as_parquet: If True, save the parsed data to '<path>.parquet' and
+                read that instead on later calls while it is newer than the CSV and
+                the call uses the same engine and kwargs it was written with
             **kwargs: Additional arguments for pd.read_csv()
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
         try:
-            print(f"📄 Reading CSV file: {path}")
-            df = pd.read_csv(path, **kwargs)
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            logger.info("Reading CSV file: %s", path)
+            cache_key = _csv_cache_key(engine, **kwargs) if cache_as_parquet else None
+            if engine != 'pyarrow' and isinstance(path, (str, os.PathLike)) and os.path.isfile(path):
+                # Let the parser read local files straight from the page cache
+                kwargs.setdefault('memory_map', True)
+            
+            if chunksize:
+                # PyArrow has no row-based chunking, so streaming always uses pandas
+                if engine is not None and engine != 'pyarrow':
+                    kwargs['engine'] = engine
+                reader = pd.read_csv(path, chunksize=chunksize, **kwargs)
+                return _ChunkIterator(reader, on_close=reader.close, transform=_shrink_dtypes if downcast else None)
+            
+            cache_path = f"{path}.parquet" if cache_as_parquet else None
+            df = _read_parquet_cache(cache_path, path, cache_key) if cache_path else None
+            if df is not None:
+                logger.info("   Using Parquet cache: %s", cache_path)
+                if downcast:
+                    df = _shrink_dtypes(df)
+                _log_loaded(df)
+                return df
+            
+            df = None
+            if parallel and _can_parallel_read_csv(path, **kwargs):
+                if engine is not None and engine != 'pyarrow':
+                    kwargs['engine'] = engine
+                df = _parallel_read_csv(path, **kwargs)
+            elif engine == 'pyarrow':
+                df = _read_csv_pyarrow(path, **kwargs)
+                engine = None
+            if df is None:
+                if engine is not None:
+                    kwargs['engine'] = engine
+                df = pd.read_csv(path, **kwargs)
+            if cache_path:
+                _write_parquet_cache(df, cache_path, cache_key)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading CSV file: {str(e)}")
+            logger.error("Error reading CSV file: %s", e)
             raise
     
-    def read_excel(self, path: str, sheet_name: Optional[str] = None, **kwargs) -> pd.DataFrame:
+    def read_excel(self, path: str, sheet_name: Optional[Union[str, int, List[Union[str, int]]]] = None,
+                   downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Dict[Any, pd.DataFrame]]:
         """
         Read Excel file
         
+        Uses the Rust-based calamine engine when python-calamine is installed
+        (pip install python-calamine) and pandas is 2.2 or newer, otherwise
+        pandas' default engine
+        (openpyxl for .xlsx). Legacy .xls files always keep the default xlrd engine.
+        
         Args:
             path: Path to Excel file
-            sheet_name: Sheet name to read (default: first sheet)
+            sheet_name: Sheet name or index to read (default: first sheet). A list
+                reads several sheets in one pass and returns a dict of DataFrames
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
             **kwargs: Additional arguments for pd.read_excel()
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or dict of DataFrames keyed by sheet if sheet_name is a list
         """
         try:
-            print(f"📊 Reading Excel file: {path}")
-            if sheet_name:
-                print(f"   Sheet: {sheet_name}")
-            df = pd.read_excel(path, sheet_name=sheet_name, **kwargs)
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
-            return df
+            logger.info("Reading Excel file: %s", path)
+            if sheet_name is not None:
+                logger.info("   Sheet: %s", sheet_name)
+            if ('engine' not in kwargs and not str(path).lower().endswith('.xls')
+                    and _PANDAS_VERSION >= (2, 2)
+                    and importlib.util.find_spec('python_calamine') is not None):
+                kwargs['engine'] = 'calamine'
+            result = pd.read_excel(path, sheet_name=0 if sheet_name is None else sheet_name, **kwargs)
+            
+            frames = result if isinstance(result, dict) else {sheet_name: result}
+            for key, df in frames.items():
+                if downcast:
+                    df = frames[key] = _shrink_dtypes(df)
+                _log_loaded(df)
+            return frames if isinstance(result, dict) else frames[sheet_name]
         except Exception as e:
-            print(f"❌ Error reading Excel file: {str(e)}")
+            logger.error("Error reading Excel file: %s", e)
             raise
     
-    def read_json(self, path: str, **kwargs) -> pd.DataFrame:
+    def read_json(self, path: str, engine: Optional[str] = None, chunksize: Optional[int] = None,
+                  downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read JSON file
         
         Args:
             path: Path to JSON file
+            engine: Parser engine. 'pyarrow' uses PyArrow's multithreaded reader
+                for line-delimited files and returns Arrow-backed dtypes, 'orjson'
+                parses whole documents with orjson without pandas' date and axis
+                conversion; both fall back to pandas for other kwargs or input
+                they cannot parse. By default pandas is used. '.jsonl' files are
+                read as line-delimited
+            chunksize: Number of lines per chunk. If given, the file is read as
+                line-delimited JSON and an iterator of DataFrames is returned
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
             **kwargs: Additional arguments for pd.read_json()
         
+        Returns:
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
+        """
+        try:
+            logger.info("Reading JSON file: %s", path)
+            if str(path).lower().endswith('.jsonl'):
+                kwargs.setdefault('lines', True)
+            
+            if chunksize:
+                kwargs.setdefault('lines', True)
+                reader = pd.read_json(path, chunksize=chunksize, **kwargs)
+                return _ChunkIterator(reader, on_close=reader.close, transform=_shrink_dtypes if downcast else None)
+            
+            df = None
+            if engine == 'pyarrow':
+                df = _read_json_pyarrow(path, **kwargs)
+                engine = None
+            elif engine == 'orjson':
+                df = _read_json_orjson(path, **kwargs)
+                engine = None
+            if df is None:
+                if engine is not None:
+                    kwargs['engine'] = engine
+                df = pd.read_json(path, **kwargs)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
+            return df
+        except Exception as e:
+            logger.error("Error reading JSON file: %s", e)
+            raise
+    
+    def read_parquet(self, path: str, columns: Optional[List[str]] = None, filters: Optional[List] = None,
+                     downcast: bool = False, **kwargs) -> pd.DataFrame:
+        """
+        Read Parquet file
+        
+        Args:
+            path: Path to Parquet file (or dataset directory)
+            columns: Columns to read (default: all)
+            filters: Row filters pushed down to the reader, e.g. [('year', '>=', 2020)]
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pyarrow.parquet.read_table()
+        
         Returns:
             pandas DataFrame
         """
         try:
-            print(f"📋 Reading JSON file: {path}")
-            df = pd.read_json(path, **kwargs)
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            logger.info("Reading Parquet file: %s", path)
+            df = _read_arrow_file(path, 'parquet', columns=columns, filters=filters, **kwargs)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading JSON file: {str(e)}")
+            logger.error("Error reading Parquet file: %s", e)
             raise
     
-    def read_sqlite_table(self, path: str, table: str, **kwargs) -> pd.DataFrame:
+    def read_feather(self, path: str, columns: Optional[List[str]] = None, downcast: bool = False,
+                     **kwargs) -> pd.DataFrame:
+        """
+        Read Feather file
+        
+        Args:
+            path: Path to Feather file
+            columns: Columns to read (default: all)
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pyarrow.feather.read_table()
+        
+        Returns:
+            pandas DataFrame
+        """
+        try:
+            logger.info("Reading Feather file: %s", path)
+            df = _read_arrow_file(path, 'feather', columns=columns, **kwargs)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
+            return df
+        except Exception as e:
+            logger.error("Error reading Feather file: %s", e)
+            raise
+    
+    def read_sqlite_table(self, path: str, table: str, chunksize: Optional[int] = None,
+                          downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read table from SQLite database
         
         Args:
             path: Path to SQLite database file
             table: Table name to read
-            **kwargs: Additional arguments for pd.read_sql()
+            chunksize: Number of rows per chunk. If given, returns an iterator
+                of DataFrames instead of a single DataFrame
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pd.read_sql(); dtype_backend
+                defaults to 'pyarrow'
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
         try:
-            print(f"🗄️  Reading SQLite table '{table}' from: {path}")
-            with sqlite3.connect(path) as conn:
-                df = pd.read_sql(f"SELECT * FROM {table}", conn, **kwargs)
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            logger.info("Reading SQLite table '%s' from: %s", table, path)
+            if chunksize:
+                conn = self._get_sqlite(path)
+                chunks = _read_sql(f"SELECT * FROM {table}", conn, chunksize=chunksize, **kwargs)
+                return _ChunkIterator(chunks, transform=_shrink_dtypes if downcast else None)
+            conn = self._get_sqlite(path)
+            df = _read_sql(f"SELECT * FROM {table}", conn, **kwargs)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading SQLite table: {str(e)}")
+            logger.error("Error reading SQLite table: %s", e)
             raise
     
-    def read_sqlite_query(self, path: str, query: str, **kwargs) -> pd.DataFrame:
+    def read_sqlite_query(self, path: str, query: str, chunksize: Optional[int] = None,
+                          downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Execute custom SQL query on SQLite database
         
         Args:
             path: Path to SQLite database file
             query: SQL query to execute
-            **kwargs: Additional arguments for pd.read_sql()
+            chunksize: Number of rows per chunk. If given, returns an iterator
+                of DataFrames instead of a single DataFrame
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pd.read_sql(); dtype_backend
+                defaults to 'pyarrow'
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
         try:
-            print(f"🔍 Executing SQLite query on: {path}")
-            print(f"   Query: {query[:100]}{'...' if len(query) > 100 else ''}")
-            with sqlite3.connect(path) as conn:
-                df = pd.read_sql(query, conn, **kwargs)
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            logger.info("Executing SQLite query on: %s", path)
+            _log_query(_SQLITE_QUERY_FMT, query)
+            if chunksize:
+                conn = self._get_sqlite(path)
+                chunks = _read_sql(query, conn, chunksize=chunksize, **kwargs)
+                return _ChunkIterator(chunks, transform=_shrink_dtypes if downcast else None)
+            conn = self._get_sqlite(path)
+            df = _read_sql(query, conn, **kwargs)
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error executing SQLite query: {str(e)}")
+            logger.error("Error executing SQLite query: %s", e)
             raise
     
     def list_sqlite_tables(self, path: str) -> List[str]:
         """
-        List all tables in SQLite database
+        List all user tables in SQLite database, skipping SQLite's internal tables
         
         Args:
             path: Path to SQLite database file
@@ -145,18 +959,71 @@ class DataConnector:
             List of table names
         """
         try:
-            with sqlite3.connect(path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-                tables = [row[0] for row in cursor.fetchall()]
-            print(f"📋 Found {len(tables)} tables: {tables}")
+            # sqlite_master is kept over PRAGMA table_list because it returns tables
+            # in creation order, which decides the default table in auto_detect_and_read()
+            cursor = self._get_sqlite(path).execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\';"
+            )
+            tables = [row[0] for row in cursor]
+            logger.info("Found %s tables: %s", len(tables), tables)
             return tables
         except Exception as e:
-            print(f"❌ Error listing SQLite tables: {str(e)}")
+            logger.error("Error listing SQLite tables: %s", e)
             raise
     
+    def _get_engine(self, dsn: str):
+        """
+        Return a pooled SQLAlchemy engine for the DSN, creating it on first use
+        
+        Args:
+            dsn: SQLAlchemy connection URL
+        
+        Returns:
+            sqlalchemy Engine
+        """
+        key = ('engine', dsn)
+        with self._cache_lock:
+            engine = self.connection_cache.get(key)
+            if engine is None:
+                try:
+                    from sqlalchemy import create_engine
+                except ImportError:
+                    raise ImportError("SQLAlchemy is required for database connections. Install with: pip install sqlalchemy")
+                engine = create_engine(dsn, pool_size=10, max_overflow=15, pool_pre_ping=True, future=True)
+                self.connection_cache[key] = engine
+        return engine
+    
+    def _read_sql_pooled(self, sql: str, dsn: str, chunksize: Optional[int] = None,
+                         downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a query on a pooled connection for the DSN
+        
+        Args:
+            sql: SQL query to execute
+            dsn: SQLAlchemy connection URL
+            chunksize: Number of rows per chunk. If given, a server-side cursor is
+                used and an iterator of DataFrames is returned
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pd.read_sql(); dtype_backend
+                defaults to 'pyarrow'
+        
+        Returns:
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
+        """
+        engine = self._get_engine(dsn)
+        if chunksize:
+            conn = engine.connect().execution_options(stream_results=True)
+            chunks = _read_sql(sql, conn, chunksize=chunksize, **kwargs)
+            return _ChunkIterator(chunks, on_close=conn.close, transform=_shrink_dtypes if downcast else None)
+        with engine.connect() as conn:
+            df = _read_sql(sql, conn, **kwargs)
+        return _shrink_dtypes(df) if downcast else df
+    
     def read_mysql(self, host: str, database: str, username: str, password: str, 
-                   table: str = None, query: str = None, port: int = 3306, **kwargs) -> pd.DataFrame:
+                   table: str = None, query: str = None, port: int = 3306,
+                   chunksize: Optional[int] = None, downcast: bool = False,
+                   backend: Optional[str] = None, limit: Optional[int] = None,
+                   **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read data from MySQL database
         
@@ -168,38 +1035,64 @@ class DataConnector:
             table: Table name to read (optional if query provided)
             query: Custom SQL query (optional if table provided)
             port: MySQL port (default: 3306)
-            **kwargs: Additional arguments for pd.read_sql()
+            chunksize: Number of rows per chunk. If given, returns an iterator
+                of DataFrames instead of a single DataFrame
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            backend: 'sqlalchemy' or 'connectorx'. The Arrow-native
+                backends decode results straight into Arrow columns but only
+                run plain, non-chunked reads and raise ValueError otherwise
+                (default: connectorx if installed, SQLAlchemy for chunked reads
+                or extra kwargs)
+            limit: Return at most this many rows, pushed down to the server as LIMIT
+            **kwargs: Additional arguments for pd.read_sql(); dtype_backend
+                defaults to 'pyarrow'
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
-        try:
-            import pymysql
-        except ImportError:
-            raise ImportError("PyMySQL is required for MySQL connections. Install with: pip install pymysql")
+        backend = _resolve_sql_backend(backend, chunksize, **kwargs)
+        if backend == 'sqlalchemy':
+            try:
+                import pymysql
+            except ImportError:
+                raise ImportError("PyMySQL is required for MySQL connections. Install with: pip install pymysql")
         
         try:
-            print(f"🐬 Connecting to MySQL: {host}:{port}/{database}")
+            logger.info("Connecting to MySQL: %s:%s/%s", host, port, database)
             
             connection_string = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
             
             if query:
-                print(f"   Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
-                df = pd.read_sql(query, connection_string, **kwargs)
+                _log_query(_EXECUTING_QUERY_FMT, query)
+                sql = query
             elif table:
-                print(f"   Reading table: {table}")
-                df = pd.read_sql(f"SELECT * FROM {table}", connection_string, **kwargs)
+                logger.info("   Reading table: %s", table)
+                sql = f"SELECT * FROM {table}"
             else:
                 raise ValueError("Either 'table' or 'query' parameter must be provided")
+            sql = _limit_sql(sql, limit)
+            
+            if chunksize:
+                return self._read_sql_pooled(sql, connection_string, chunksize=chunksize,
+                                             downcast=downcast, **kwargs)
+            if backend == 'sqlalchemy':
+                df = self._read_sql_pooled(sql, connection_string, downcast=downcast, **kwargs)
+            else:
+                df = _read_sql_arrow(sql, connection_string, backend)
+                if downcast:
+                    df = _shrink_dtypes(df)
             
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading from MySQL: {str(e)}")
+            logger.error("Error reading from MySQL: %s", e)
             raise
     
     def read_postgresql(self, host: str, database: str, username: str, password: str,
-                       table: str = None, query: str = None, port: int = 5432, **kwargs) -> pd.DataFrame:
+                        table: str = None, query: str = None, port: int = 5432,
+                        chunksize: Optional[int] = None, downcast: bool = False,
+                        backend: Optional[str] = None, limit: Optional[int] = None,
+                        **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read data from PostgreSQL database
         
@@ -211,38 +1104,98 @@ class DataConnector:
             table: Table name to read (optional if query provided)
             query: Custom SQL query (optional if table provided)
             port: PostgreSQL port (default: 5432)
-            **kwargs: Additional arguments for pd.read_sql()
+            chunksize: Number of rows per chunk. If given, returns an iterator
+                of DataFrames instead of a single DataFrame
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            backend: 'sqlalchemy', 'connectorx', or 'adbc'. The Arrow-native
+                backends decode results straight into Arrow columns but only
+                run plain, non-chunked reads and raise ValueError otherwise
+                (default: connectorx if installed, SQLAlchemy for chunked reads
+                or extra kwargs)
+            limit: Return at most this many rows, pushed down to the server as LIMIT
+            **kwargs: Additional arguments for pd.read_sql(); dtype_backend
+                defaults to 'pyarrow'
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
-        try:
-            import psycopg2
-        except ImportError:
-            raise ImportError("psycopg2 is required for PostgreSQL connections. Install with: pip install psycopg2-binary")
+        backend = _resolve_sql_backend(backend, chunksize, **kwargs)
+        if backend == 'sqlalchemy':
+            try:
+                import psycopg2
+            except ImportError:
+                raise ImportError("psycopg2 is required for PostgreSQL connections. Install with: pip install psycopg2-binary")
         
         try:
-            print(f"🐘 Connecting to PostgreSQL: {host}:{port}/{database}")
+            logger.info("Connecting to PostgreSQL: %s:%s/%s", host, port, database)
             
             connection_string = f"postgresql://{username}:{password}@{host}:{port}/{database}"
             
             if query:
-                print(f"   Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
-                df = pd.read_sql(query, connection_string, **kwargs)
+                _log_query(_EXECUTING_QUERY_FMT, query)
+                sql = query
             elif table:
-                print(f"   Reading table: {table}")
-                df = pd.read_sql(f"SELECT * FROM {table}", connection_string, **kwargs)
+                logger.info("   Reading table: %s", table)
+                sql = f"SELECT * FROM {table}"
             else:
                 raise ValueError("Either 'table' or 'query' parameter must be provided")
+            sql = _limit_sql(sql, limit)
+            
+            if chunksize:
+                return self._read_sql_pooled(sql, connection_string, chunksize=chunksize,
+                                             downcast=downcast, **kwargs)
+            if backend == 'sqlalchemy':
+                df = self._read_sql_pooled(sql, connection_string, downcast=downcast, **kwargs)
+            else:
+                df = _read_sql_arrow(sql, connection_string, backend)
+                if downcast:
+                    df = _shrink_dtypes(df)
             
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading from PostgreSQL: {str(e)}")
+            logger.error("Error reading from PostgreSQL: %s", e)
             raise
     
+    def _get_bigquery_clients(self, project_id: str, credentials_path: Optional[str] = None):
+        """
+        Return cached BigQuery query and Storage Read API clients for a project
+        
+        Args:
+            project_id: Google Cloud project ID
+            credentials_path: Path to service account JSON file (optional)
+        
+        Returns:
+            Tuple of (bigquery.Client, BigQueryReadClient, credentials); the read
+            client is None when google-cloud-bigquery-storage is not installed, and
+            credentials is None when application default credentials are used
+        """
+        key = ('bigquery', project_id, credentials_path)
+        with self._cache_lock:
+            clients = self.connection_cache.get(key)
+            if clients is None:
+                try:
+                    from google.cloud import bigquery
+                except ImportError:
+                    raise ImportError("google-cloud-bigquery is required for BigQuery connections. "
+                                      "Install with: pip install google-cloud-bigquery")
+                credentials = None
+                if credentials_path:
+                    from google.oauth2 import service_account
+                    credentials = service_account.Credentials.from_service_account_file(credentials_path)
+                client = bigquery.Client(project=project_id, credentials=credentials)
+                try:
+                    from google.cloud import bigquery_storage
+                    read_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+                except ImportError:
+                    read_client = None
+                clients = (client, read_client, credentials)
+                self.connection_cache[key] = clients
+        return clients
+    
     def read_bigquery(self, project_id: str, query: str = None, table_id: str = None, 
-                     credentials_path: str = None, **kwargs) -> pd.DataFrame:
+                     credentials_path: str = None, chunksize: Optional[int] = None,
+                     downcast: bool = False, **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Read data from Google BigQuery
         
@@ -251,39 +1204,58 @@ class DataConnector:
             query: SQL query to execute (optional if table_id provided)
             table_id: Full table ID in format 'project.dataset.table' (optional if query provided)
             credentials_path: Path to service account JSON file (optional)
-            **kwargs: Additional arguments for pd.read_gbq()
+            chunksize: Number of rows per page. If given, results are paged through
+                and an iterator of DataFrames is returned; cannot be combined with
+                read_gbq kwargs
+            downcast: If True, convert to Arrow-backed dtypes and downcast numeric columns
+            **kwargs: Additional arguments for pandas_gbq.read_gbq(). Without them,
+                results are downloaded through the BigQuery Storage Read API
         
         Returns:
-            pandas DataFrame
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
         """
         try:
-            import pandas_gbq
-        except ImportError:
-            raise ImportError("pandas-gbq is required for BigQuery connections. Install with: pip install pandas-gbq")
-        
-        try:
-            print(f"☁️  Connecting to BigQuery project: {project_id}")
+            if chunksize and kwargs:
+                raise ValueError(f"chunksize cannot be combined with read_gbq arguments: {', '.join(sorted(kwargs))}")
+            logger.info("Connecting to BigQuery project: %s", project_id)
             
-            # Set up authentication if credentials path provided
+            client, read_client, credentials = self._get_bigquery_clients(project_id, credentials_path)
             if credentials_path:
-                import os
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-                print(f"   Using credentials: {credentials_path}")
+                logger.info("   Using credentials: %s", credentials_path)
             
             if query:
-                print(f"   Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
-                df = pandas_gbq.read_gbq(query, project_id=project_id, **kwargs)
+                _log_query(_EXECUTING_QUERY_FMT, query)
             elif table_id:
-                print(f"   Reading table: {table_id}")
+                logger.info("   Reading table: %s", table_id)
                 query = f"SELECT * FROM `{table_id}`"
-                df = pandas_gbq.read_gbq(query, project_id=project_id, **kwargs)
             else:
                 raise ValueError("Either 'query' or 'table_id' parameter must be provided")
             
-            print(f"✅ Successfully loaded {df.shape[0]:,} rows and {df.shape[1]} columns")
+            if chunksize:
+                # pandas-gbq has no chunked mode; page through the result set instead
+                rows = client.query(query).result(page_size=chunksize)
+                return _ChunkIterator(rows.to_dataframe_iterable(bqstorage_client=read_client),
+                                      transform=_shrink_dtypes if downcast else None)
+            if kwargs:
+                try:
+                    import pandas_gbq
+                except ImportError:
+                    raise ImportError("pandas-gbq is required for read_gbq options. Install with: pip install pandas-gbq")
+                kwargs.setdefault('use_bqstorage_api', True)
+                kwargs.setdefault('progress_bar_type', None)
+                df = pandas_gbq.read_gbq(query, project_id=project_id, credentials=credentials, **kwargs)
+            else:
+                # to_dataframe() keeps BigQuery's dtype mapping (nullable INTEGER -> Int64,
+                # DATE -> date objects) while still downloading through the Storage Read API
+                df = client.query(query).result().to_dataframe(bqstorage_client=read_client,
+                                                               progress_bar_type=None)
+            
+            if downcast:
+                df = _shrink_dtypes(df)
+            _log_loaded(df)
             return df
         except Exception as e:
-            print(f"❌ Error reading from BigQuery: {str(e)}")
+            logger.error("Error reading from BigQuery: %s", e)
             raise
     
     def auto_detect_and_read(self, path: str, **kwargs) -> pd.DataFrame:
@@ -293,80 +1265,256 @@ class DataConnector:
         Args:
             path: Path to data file
             **kwargs: Additional arguments passed to respective read functions
+                (e.g. chunksize, downcast)
         
         Returns:
             pandas DataFrame
         """
-        file_path = Path(path)
-        extension = file_path.suffix.lower()
+        extension = Path(path).suffix.lower()
         
-        print(f"🔍 Auto-detecting file type: {extension}")
+        logger.info("Auto-detecting file type: %s", extension)
         
-        if extension == '.csv':
-            return self.read_csv(path, **kwargs)
-        elif extension in ['.xlsx', '.xls']:
-            return self.read_excel(path, **kwargs)
-        elif extension == '.json':
-            return self.read_json(path, **kwargs)
-        elif extension in ['.db', '.sqlite', '.sqlite3']:
-            # For SQLite, we need table name
+        handler = self._lookup_handler(extension)
+        if isinstance(handler, str):
+            return getattr(self, handler)(path, **kwargs)
+        return handler(self, path, **kwargs)
+    
+    def _lookup_handler(self, extension: str) -> Union[str, Callable[..., Any]]:
+        """Return the registered reader for a file extension"""
+        try:
+            return self._DISPATCH[extension]
+        except KeyError:
+            raise ValueError(f"Unsupported file format: {extension}") from None
+    
+    def _read_sqlite_auto(self, path: str, table: Optional[str] = None,
+                          **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Read a table from a SQLite database, defaulting to the first table
+        
+        The table listing and the read share one cached connection, and the
+        listing is skipped entirely when a table name is given.
+        
+        Args:
+            path: Path to SQLite database file
+            table: Table name to read (default: first table in the database)
+            **kwargs: Additional arguments for read_sqlite_table()
+        
+        Returns:
+            pandas DataFrame, or iterator of DataFrames if chunksize is given
+        """
+        if table is None:
             tables = self.list_sqlite_tables(path)
             if not tables:
                 raise ValueError("No tables found in SQLite database")
-            if 'table' in kwargs:
-                return self.read_sqlite_table(path, kwargs.pop('table'), **kwargs)
+            table = tables[0]
+            if len(tables) > 1:
+                logger.warning("Multiple tables found. Reading first table: %s", table)
+        return self.read_sqlite_table(path, table, **kwargs)
+    
+    async def _aread_many(self, paths: List[str], pool: Executor, **kwargs) -> List[pd.DataFrame]:
+        """
+        Read several files concurrently on an executor
+        
+        Args:
+            paths: Paths to data files
+            pool: Executor to run each read on
+            **kwargs: Additional arguments passed to auto_detect_and_read()
+        
+        Returns:
+            List of DataFrames in the same order as paths
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(pool, lambda p=p: self.auto_detect_and_read(p, **kwargs))
+            for p in paths
+        ))
+    
+    def read_many(self, paths: Iterable[str], max_workers: int = 8, concat: bool = False,
+                  **kwargs) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+        """
+        Read several files concurrently using a thread pool
+        
+        Args:
+            paths: Paths to data files
+            max_workers: Maximum number of files read at the same time
+            concat: If True, concatenate all results into one DataFrame
+            **kwargs: Additional arguments passed to auto_detect_and_read()
+        
+        Returns:
+            Dict mapping each path to its DataFrame, or a single concatenated
+            DataFrame if concat is True
+        """
+        paths = list(paths)
+        logger.info("Reading %s files with up to %s workers", len(paths), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                frames = asyncio.run(self._aread_many(paths, pool, **kwargs))
             else:
-                print(f"⚠️  Multiple tables found. Reading first table: {tables[0]}")
-                return self.read_sqlite_table(path, tables[0], **kwargs)
-        else:
-            raise ValueError(f"Unsupported file format: {extension}")
+                # asyncio.run() cannot be nested inside a running loop (e.g. Jupyter)
+                frames = list(pool.map(lambda p: self.auto_detect_and_read(p, **kwargs), paths))
+        
+        if concat:
+            return pd.concat(frames, ignore_index=True)
+        return dict(zip(paths, frames))
+
+    def peek(self, path: str, n: int = 5, **kwargs) -> pd.DataFrame:
+        """
+        Preview the first rows of a data file without reading all of it
+        
+        Args:
+            path: Path to data file
+            n: Number of rows to return
+            **kwargs: Format-specific options (e.g. table for SQLite)
+        
+        Returns:
+            pandas DataFrame with at most n rows
+        """
+        handler = self._lookup_handler(Path(path).suffix.lower())
+        logger.info("Previewing %s rows of: %s", n, path)
+        peek_method = self._PEEK_DISPATCH.get(handler) if isinstance(handler, str) else None
+        if peek_method is not None:
+            return getattr(self, peek_method)(path, n, **kwargs)
+        
+        # Readers registered without a preview method fall back to a full read
+        return self.auto_detect_and_read(path, **kwargs).head(n)
+    
+    def schema(self, path: str, **kwargs) -> pd.Series:
+        """
+        Return the column types of a data file without reading all of it
+        
+        Parquet and Feather types come from the stored schema; other formats,
+        including SQLite, report the dtypes the matching read_* method infers
+        for a sample of the first rows.
+        
+        Args:
+            path: Path to data file
+            **kwargs: Format-specific options (e.g. table for SQLite)
+        
+        Returns:
+            pandas Series mapping column name to dtype
+        """
+        handler = self._lookup_handler(Path(path).suffix.lower())
+        if handler == 'read_parquet':
+            import pyarrow.parquet as pq
+            return pq.read_schema(path).empty_table().to_pandas().dtypes
+        if handler == 'read_feather':
+            import pyarrow as pa
+            with pa.memory_map(str(path)) as source:
+                return pa.ipc.open_file(source).schema.empty_table().to_pandas().dtypes
+        return self.peek(path, n=self._SCHEMA_SAMPLE_ROWS, **kwargs).dtypes
+    
+    def _first_sqlite_table(self, path: str) -> str:
+        """Return the first table of a SQLite database"""
+        tables = self.list_sqlite_tables(path)
+        if not tables:
+            raise ValueError("No tables found in SQLite database")
+        return tables[0]
+    
+    def _peek_csv(self, path: str, n: int, **kwargs) -> pd.DataFrame:
+        """Read the first rows of a CSV file with the same type inference as read_csv()"""
+        return pd.read_csv(path, nrows=n, **kwargs)
+    
+    def _peek_excel(self, path: str, n: int, **kwargs) -> pd.DataFrame:
+        """Read the first rows of an Excel sheet"""
+        return self.read_excel(path, nrows=n, **kwargs)
+    
+    def _peek_json(self, path: str, n: int, **kwargs) -> pd.DataFrame:
+        """Read the first lines of a line-delimited JSON file, or the head of a document"""
+        if str(path).lower().endswith('.jsonl'):
+            kwargs.setdefault('lines', True)
+        if kwargs.get('lines'):
+            return pd.read_json(path, nrows=n, **kwargs)
+        return self.read_json(path, **kwargs).head(n)
+    
+    def _peek_parquet(self, path: str, n: int, **kwargs) -> pd.DataFrame:
+        """Read the first rows of a Parquet file from its first row group"""
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        batch = next(parquet_file.iter_batches(batch_size=n, **kwargs), None)
+        if batch is None:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+        return batch.to_pandas()
+    
+    def _peek_feather(self, path: str, n: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the first rows of a memory-mapped Feather file, one record batch at a time"""
+        import pyarrow as pa
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            batches, rows = [], 0
+            for i in range(reader.num_record_batches):
+                if rows >= n:
+                    break
+                batch = reader.get_batch(i)
+                batches.append(batch)
+                rows += batch.num_rows
+            table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, n)
+            if columns is not None:
+                table = table.select(columns)
+            return table.to_pandas()
+    
+    def _peek_sqlite(self, path: str, n: int, table: Optional[str] = None, **kwargs) -> pd.DataFrame:
+        """Read the first rows of a SQLite table with LIMIT"""
+        table = table or self._first_sqlite_table(path)
+        return _read_sql(f"SELECT * FROM {table} LIMIT ?", self._get_sqlite(path), params=(int(n),), **kwargs)
+
+_default: Optional[DataConnector] = None
+_default_lock = threading.Lock()
+
+
+def get_default() -> DataConnector:
+    """Return the shared DataConnector used by the convenience functions, creating it on first use"""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = DataConnector()
+    return _default
+
+
+def __getattr__(name: str):
+    # Keep the old module-level `data_connector` instance importable without creating it at import time
+    if name == 'data_connector':
+        return get_default()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Convenience functions for backward compatibility
 def read_csv(path: str, **kwargs) -> pd.DataFrame:
     """Convenience function to read CSV"""
-    connector = DataConnector()
-    return connector.read_csv(path, **kwargs)
+    return get_default().read_csv(path, **kwargs)
 
 def read_excel(path: str, **kwargs) -> pd.DataFrame:
     """Convenience function to read Excel"""
-    connector = DataConnector()
-    return connector.read_excel(path, **kwargs)
+    return get_default().read_excel(path, **kwargs)
 
 def read_json(path: str, **kwargs) -> pd.DataFrame:
     """Convenience function to read JSON"""
-    connector = DataConnector()
-    return connector.read_json(path, **kwargs)
+    return get_default().read_json(path, **kwargs)
 
 def read_sqlite_table(path: str, table: str, **kwargs) -> pd.DataFrame:
     """Convenience function to read SQLite table"""
-    connector = DataConnector()
-    return connector.read_sqlite_table(path, table, **kwargs)
+    return get_default().read_sqlite_table(path, table, **kwargs)
 
 def read_sqlite_query(path: str, query: str, **kwargs) -> pd.DataFrame:
     """Convenience function to execute SQLite query"""
-    connector = DataConnector()
-    return connector.read_sqlite_query(path, query, **kwargs)
+    return get_default().read_sqlite_query(path, query, **kwargs)
 
 def read_mysql(host: str, database: str, username: str, password: str, 
                table: str = None, query: str = None, **kwargs) -> pd.DataFrame:
     """Convenience function to read from MySQL"""
-    connector = DataConnector()
-    return connector.read_mysql(host, database, username, password, table, query, **kwargs)
+    return get_default().read_mysql(host, database, username, password, table, query, **kwargs)
 
 def read_postgresql(host: str, database: str, username: str, password: str,
                    table: str = None, query: str = None, **kwargs) -> pd.DataFrame:
     """Convenience function to read from PostgreSQL"""
-    connector = DataConnector()
-    return connector.read_postgresql(host, database, username, password, table, query, **kwargs)
+    return get_default().read_postgresql(host, database, username, password, table, query, **kwargs)
 
 def read_bigquery(project_id: str, query: str = None, table_id: str = None, 
                  credentials_path: str = None, **kwargs) -> pd.DataFrame:
     """Convenience function to read from BigQuery"""
-    connector = DataConnector()
-    return connector.read_bigquery(project_id, query, table_id, credentials_path, **kwargs)
-
-# Create global instance for easy access
-data_connector = DataConnector()
+    return get_default().read_bigquery(project_id, query, table_id, credentials_path, **kwargs)
 
 if __name__ == "__main__":
     print("🔌 Data Connector Module")
@@ -375,6 +1523,7 @@ if __name__ == "__main__":
     print("• CSV files")
     print("• Excel files (.xlsx, .xls)")
     print("• JSON files")
+    print("• Parquet / Feather files")
     print("• SQLite databases")
     print("• MySQL databases")
     print("• PostgreSQL databases")